@@ -0,0 +1,108 @@
+"""
+Overhead of tool argument validation and model round trips it saves.
+
+Times json.loads against the compiled parse/validate/coerce path, then
+replays a corpus of malformed tool calls against the built-in tools and
+compares the old handling (raw json.loads straight into execute) with
+the new one. Round trips count model calls until a correct answer,
+assuming the model fixes its call after one error:
+
+- old, tool ran: 2 (tool call, final answer)
+- old, tool returned an error: 4 (the only tool round is spent, so the
+  user has to resend the message)
+- old, turn aborted on bad JSON: 3 (one wasted call, then a resend)
+- new, arguments coerced: 2
+- new, structured error: 3 (tool call, corrected retry, final answer)
+
+Run from anywhere:
+
+    python benchmarks/argument_validation.py
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CORPUS = [
+    ("calculate", '{"expression": "2+2"', "truncated JSON"),
+    ("calculate", "{'expression': '2+2'}", "single quotes"),
+    ("calculate", '{"expression": 42}', "number for a string"),
+    ("calculate", '{"expr": "2+2"}', "wrong parameter name"),
+    ("calculate", "{}", "missing required"),
+    ("calculate", '["2+2"]', "array instead of object"),
+    ("file_operations", '{"operation": "read", "path": "README.md"}', "value not in enum"),
+    ("file_operations", '{"operation": "read_file"}', "missing path"),
+    ("file_operations", '{"operation": "list_directory", "path": ".", "recursive": true}',
+     "unexpected argument"),
+    ("get_datetime", '{"format": "unix"}', "value not in enum"),
+    ("get_datetime", '{"format": 5}', "wrong type and enum"),
+    ("calculate", '{"expression": "2+2", "precision": 2}', "unexpected argument"),
+]
+
+VALID_CALL = ("file_operations", '{"operation": "list_directory", "path": "."}')
+
+
+def old_round_trips(registry, name: str, raw: str) -> int:
+    """Model calls to a correct answer with the old json.loads-and-execute path."""
+    try:
+        arguments = json.loads(raw)
+        result = registry.execute_tool(name, **arguments)
+    except (json.JSONDecodeError, TypeError):
+        # Raised out of the tool-call loop and aborted the turn
+        return 3
+    return 4 if str(result).startswith("Error") else 2
+
+
+def new_round_trips(registry, name: str, raw: str) -> int:
+    """Model calls to a correct answer with compiled validation."""
+    from tools.validation import ToolArgumentError
+
+    try:
+        registry.parse_arguments(registry.get_tool(name), raw)
+    except ToolArgumentError:
+        return 3
+    return 2
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=100000,
+                        help="calls per timing measurement")
+    args = parser.parse_args()
+
+    # Tool discovery is relative to the working directory
+    os.chdir(ROOT)
+    sys.path.insert(0, str(ROOT))
+    from tools.registry import ToolRegistry
+
+    registry = ToolRegistry(quiet=True)
+    registry.auto_discover_tools()
+
+    name, raw = VALID_CALL
+    tool = registry.get_tool(name)
+    parse_only = timeit.timeit(lambda: json.loads(raw), number=args.number) / args.number
+    validated = timeit.timeit(lambda: registry.parse_arguments(tool, raw),
+                              number=args.number) / args.number
+    print(f"json.loads: {parse_only * 1e6:.2f} us, parse + validate + coerce: "
+          f"{validated * 1e6:.2f} us, overhead {(validated - parse_only) * 1e6:.2f} us per call")
+
+    print(f"\n{'case':50} {'old':>4} {'new':>4}")
+    old_total = new_total = 0
+    for name, raw, label in CORPUS:
+        old = old_round_trips(registry, name, raw)
+        new = new_round_trips(registry, name, raw)
+        old_total += old
+        new_total += new
+        print(f"{name + ': ' + label:50} {old:>4} {new:>4}")
+
+    print(f"\n{len(CORPUS)} malformed calls: {old_total} model calls before, {new_total} after, "
+          f"{old_total - new_total} saved")
+
+
+if __name__ == "__main__":
+    main()
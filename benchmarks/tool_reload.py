@@ -0,0 +1,119 @@
+"""
+Latency and memory growth of hot-reloading a tool module.
+
+Rewrites a tool file in a temporary directory, lets the ToolWatcher pick
+up each change while a reader thread keeps querying the registry, and
+reports reload latency, traced memory growth and how many replaced tool
+classes are still alive. Run from anywhere:
+
+    python benchmarks/tool_reload.py --reloads 1000
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+TOOL_SOURCE = '''
+from typing import List
+from tools.base import BaseTool, ToolParameter
+
+VERSION = {version}
+
+
+class ReloadBenchTool(BaseTool):
+    @property
+    def name(self) -> str:
+        return "reload_bench_{version}"
+
+    @property
+    def description(self) -> str:
+        return "Tool rewritten by the reload benchmark (version {version})"
+
+    @property
+    def parameters(self) -> List[ToolParameter]:
+        return []
+
+    def execute(self) -> int:
+        return VERSION
+'''
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--reloads", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=100,
+                        help="reloads before the memory baseline is taken")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(ROOT))
+    from tools.registry import ToolRegistry
+    from tools.watcher import ToolWatcher
+
+    registry = ToolRegistry(quiet=True)
+    errors = []
+    stop = threading.Event()
+
+    def reader() -> None:
+        while not stop.is_set():
+            try:
+                registry.get_openai_tools()
+                registry.select_tools("reload benchmark", 3)
+            except Exception as e:
+                errors.append(e)
+
+    with tempfile.TemporaryDirectory() as directory:
+        tool_file = Path(directory) / "reload_bench_tool.py"
+        watcher = ToolWatcher(registry, tools_dir=directory)
+        tool_file.write_text(TOOL_SOURCE.format(version=0))
+        watcher.poll()
+        first_tool = registry.get_tool("reload_bench_0")
+
+        thread = threading.Thread(target=reader, daemon=True)
+        thread.start()
+        tracemalloc.start()
+
+        latencies = []
+        baseline = 0
+        for version in range(1, args.reloads + 1):
+            tool_file.write_text(TOOL_SOURCE.format(version=version))
+            start = time.perf_counter()
+            watcher.poll()
+            latencies.append(time.perf_counter() - start)
+
+            if not registry.list_tools() == [f"reload_bench_{version}"]:
+                raise RuntimeError(f"reload {version} did not swap the tool in")
+            if version == args.warmup:
+                gc.collect()
+                baseline = tracemalloc.get_traced_memory()[0]
+
+        gc.collect()
+        growth = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+        stop.set()
+        thread.join()
+
+    # The current version is still registered, so it does not count as replaced
+    replaced_alive = sum(
+        1 for obj in gc.get_objects()
+        if isinstance(obj, type) and obj.__name__ == "ReloadBenchTool"
+    ) - 1
+    latencies.sort()
+    count = len(latencies)
+    print(f"{count} reloads, reader errors: {len(errors)}")
+    print(f"reload latency: p50 {latencies[count // 2] * 1e3:.2f} ms, "
+          f"p99 {latencies[int(count * 0.99)] * 1e3:.2f} ms")
+    print(f"traced memory growth after reload {args.warmup}: {growth / 1024:.1f} KiB "
+          f"({growth / max(count - args.warmup, 1):.0f} B per reload)")
+    print(f"replaced tool classes still alive: {replaced_alive} "
+          f"(1 expected: the instance held from version 0, which returns {first_tool.execute()})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Prompt-token savings of relevance-based tool selection.
+
+Builds a synthetic registry of the built-in tools plus generated filler
+tools, then compares the size of the tool schemas sent per request with
+and without selection for precise, vague and unrelated queries. Tokens
+are estimated at 4 characters per token of schema JSON. Run from anywhere:
+
+    python benchmarks/tool_selection.py --tools 200 --top-k 8
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+
+VERBS = "get list create delete update search convert compute fetch send parse translate".split()
+NOUNS = ("weather stock email calendar image invoice user order ticket currency recipe "
+         "flight hotel song note task contact repo").split()
+
+QUERIES = {
+    "precise": [
+        "What time is it?",
+        "read the file README.md",
+        "What's 15 * 7 + 23?",
+        "convert 100 USD to EUR currency",
+        "show the weather forecast for Paris",
+        "send an email to Alice",
+    ],
+    "vague": [
+        "fetch my stuff and update the records",
+        "search everything about my order and invoice",
+        "list the contact, calendar and task items",
+    ],
+    "unrelated": [
+        "how are you",
+        "tell me a joke",
+        "thanks!",
+    ],
+}
+
+
+def estimate_tokens(schemas: List[dict]) -> float:
+    """Estimate prompt tokens for a list of tool schemas."""
+    return len(json.dumps(schemas)) / 4
+
+
+def build_registry(size: int, seed: int):
+    """Register the built-in tools plus generated filler tools."""
+    from tools.base import BaseTool, ToolParameter
+    from tools.registry import ToolRegistry
+
+    class SyntheticTool(BaseTool):
+        def __init__(self, name: str, noun: str, verb: str):
+            self._name = name
+            self._description = (f"{verb.capitalize()} {noun} records from the {noun} service "
+                                  f"and return a summary")
+            self._parameters = [
+                ToolParameter(name="query", type="string",
+                              description=f"The {noun} identifier or search text"),
+                ToolParameter(name="limit", type="integer",
+                              description="Maximum number of results", required=False),
+            ]
+
+        @property
+        def name(self) -> str:
+            return self._name
+
+        @property
+        def description(self) -> str:
+            return self._description
+
+        @property
+        def parameters(self) -> List[ToolParameter]:
+            return self._parameters
+
+        def execute(self, **kwargs) -> str:
+            return "ok"
+
+    registry = ToolRegistry(quiet=True)
+    registry.auto_discover_tools()
+    rng = random.Random(seed)
+    for index in range(size - len(registry.list_tools())):
+        verb, noun = rng.choice(VERBS), rng.choice(NOUNS)
+        registry.register(SyntheticTool(f"{verb}_{noun}_{index}", noun, verb))
+    return registry
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tools", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Tool discovery is relative to the working directory
+    os.chdir(ROOT)
+    sys.path.insert(0, str(ROOT))
+    registry = build_registry(args.tools, args.seed)
+    full = estimate_tokens(registry.get_openai_tools())
+    print(f"{len(registry.list_tools())} tools, full set ~{full:.0f} tokens per request, "
+          f"top_k={args.top_k}")
+
+    # Build the index before timing selection
+    registry.select_tools("", args.top_k)
+
+    totals = []
+    for kind, queries in QUERIES.items():
+        print(f"\n{kind} queries:")
+        for query in queries:
+            start = time.perf_counter()
+            names = registry.select_tools(query, args.top_k)
+            elapsed = time.perf_counter() - start
+            tokens = estimate_tokens(registry.get_openai_tools(names))
+            totals.append(tokens)
+            shown = "full set" if len(names) == args.tools else ", ".join(names)
+            print(f"  {query!r:50} ~{tokens:6.0f} tokens ({100 * (1 - tokens / full):5.1f}% saved, "
+                  f"{elapsed * 1e3:.2f} ms)  {shown}")
+
+    average = sum(totals) / len(totals)
+    print(f"\naverage ~{average:.0f} tokens per request, {100 * (1 - average / full):.1f}% saved")
+
+
+if __name__ == "__main__":
+    main()
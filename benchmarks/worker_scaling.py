@@ -0,0 +1,118 @@
+"""
+Throughput of WorkerPool at different worker counts.
+
+Uses a stubbed OpenAI client that burns a fixed amount of CPU per
+completion, so results reflect how well the pool spreads CPU-bound work
+across cores rather than network latency. Run from anywhere:
+
+    python benchmarks/worker_scaling.py --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Each completion first asks for the calculator, then answers once the
+# tool result is in the history
+STUB_OPENAI = '''
+import json
+import os
+import time
+from types import SimpleNamespace
+
+
+def _burn(seconds):
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+
+
+class _Completions:
+    def create(self, messages, **kwargs):
+        _burn(float(os.environ["BENCH_CPU_MS"]) / 1000)
+        if messages[-1]["role"] == "user":
+            call = SimpleNamespace(
+                id="call_1",
+                function=SimpleNamespace(
+                    name="calculate",
+                    arguments=json.dumps({"expression": "(1 + 2) * 3"})
+                )
+            )
+            message = SimpleNamespace(content=None, tool_calls=[call])
+        else:
+            message = SimpleNamespace(content="done", tool_calls=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class OpenAI:
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=_Completions())
+'''
+
+
+def install_stub(directory: str) -> None:
+    """Put the stub client ahead of the real openai package.
+
+    Spawned workers inherit the parent's sys.path, so they pick it up too.
+    """
+    package = Path(directory) / "openai"
+    package.mkdir()
+    (package / "__init__.py").write_text(STUB_OPENAI)
+    sys.path.insert(0, directory)
+
+
+def run(workers: int, messages: int, sessions: int, directory: str) -> float:
+    """Send a batch through a fresh pool and return messages per second."""
+    from chatbot import Config, WorkerPool
+
+    config = Config(openai_api_key="stub", hot_reload=False)
+    store_path = os.path.join(directory, f"bench-{workers}.db")
+    batch = [(f"session-{i % sessions}", f"message {i}") for i in range(messages)]
+
+    with WorkerPool(config, workers=workers, store_path=store_path) as pool:
+        # Warm up so process start-up and tool discovery are not timed
+        pool.chat_batch([(f"warmup-{i}", "hello") for i in range(workers * 2)])
+
+        start = time.perf_counter()
+        responses = pool.chat_batch(batch)
+        elapsed = time.perf_counter() - start
+
+    failed = [response for response in responses if response != "done"]
+    if failed:
+        raise RuntimeError(f"{len(failed)} requests failed, e.g. {failed[0]!r}")
+    return messages / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--messages", type=int, default=400)
+    parser.add_argument("--sessions", type=int, default=32)
+    parser.add_argument("--cpu-ms", type=float, default=5.0,
+                        help="CPU time burned per stubbed completion")
+    args = parser.parse_args()
+
+    # Workers discover tools relative to the working directory
+    os.chdir(ROOT)
+    sys.path.insert(0, str(ROOT))
+    os.environ["BENCH_CPU_MS"] = str(args.cpu_ms)
+
+    with tempfile.TemporaryDirectory() as directory:
+        install_stub(directory)
+
+        print(f"{os.cpu_count()} CPUs, {args.messages} messages over {args.sessions} sessions, "
+              f"{args.cpu_ms:g} ms CPU per completion")
+        baseline = None
+        for workers in args.workers:
+            throughput = run(workers, args.messages, args.sessions, directory)
+            baseline = baseline or throughput
+            print(f"{workers:>3} workers: {throughput:8.1f} msg/s  ({throughput / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,5 +4,6 @@ CLI Chatbot with OpenAI integration and modular tool support.
 
 from .bot import ChatBot
 from .config import Config
+from .workers import WorkerPool
 
-__all__ = ["ChatBot", "Config"] 
\ No newline at end of file
+__all__ = ["ChatBot", "Config", "WorkerPool"] 
\ No newline at end of file
@@ -3,12 +3,16 @@ Main ChatBot class with OpenAI integration.
 """
 
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from openai import OpenAI
 from rich.console import Console
 
 from .config import Config
+from .store import SharedStore
+from tools.base import BaseTool
 from tools.registry import ToolRegistry
+from tools.validation import ToolArgumentError
+from tools.watcher import ToolWatcher
 from utils.formatting import (
     format_message, format_error, format_tool_call, 
     format_tool_result, format_welcome, format_help
@@ -16,15 +20,23 @@ from utils.formatting import (
 
 console = Console()
 
+# Number of recent user turns used to pick relevant tools
+SELECTION_TURNS = 3
+
 
 class ChatBot:
     """Main chatbot class with OpenAI integration and tool support."""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, store: Optional[SharedStore] = None,
+                 quiet: bool = False):
         self.config = config
+        self.store = store
+        self.quiet = quiet
         self.client = OpenAI(api_key=config.openai_api_key)
-        self.tool_registry = ToolRegistry()
+        self.tool_registry = ToolRegistry(quiet=quiet)
         self.conversation_history: List[Dict[str, Any]] = []
+        self.used_tools: Set[str] = set()
+        self.tool_watcher: Optional[ToolWatcher] = None
         
         # Initialize with system message
         self.conversation_history.append({
@@ -32,6 +44,23 @@ class ChatBot:
             "content": config.system_prompt
         })
     
+    def get_state(self) -> Dict[str, Any]:
+        """Get the session state so it can be saved and restored elsewhere."""
+        return {
+            "conversation_history": self.conversation_history,
+            "used_tools": sorted(self.used_tools)
+        }
+    
+    def set_state(self, state: Optional[Dict[str, Any]]) -> None:
+        """Restore a saved session state, or start a fresh session if None."""
+        if state is None:
+            state = {
+                "conversation_history": [{"role": "system", "content": self.config.system_prompt}],
+                "used_tools": []
+            }
+        self.conversation_history = state["conversation_history"]
+        self.used_tools = set(state["used_tools"])
+    
     def register_tool(self, tool) -> None:
         """Register a tool with the chatbot."""
         self.tool_registry.register(tool)
@@ -40,20 +69,57 @@ class ChatBot:
         """Auto-discover tools from the tools/available directory."""
         self.tool_registry.auto_discover_tools()
     
-    def _handle_tool_calls(self, tool_calls) -> None:
-        """Handle tool calls from the assistant."""
+    def _select_tools(self) -> List[Dict[str, Any]]:
+        """Get the tools to send for this turn, trimmed to the most relevant ones."""
+        top_k = self.config.tool_top_k
+        if top_k <= 0 or len(self.tool_registry.list_tools()) <= top_k:
+            return self.tool_registry.get_openai_tools()
+        
+        # Score against recent user turns so follow-ups like "now do the same
+        # for 9" still find the tools the conversation is about
+        user_turns = [
+            entry["content"] for entry in self.conversation_history
+            if entry["role"] == "user" and entry.get("content")
+        ]
+        query = " ".join(user_turns[-SELECTION_TURNS:])
+        
+        names = self.tool_registry.select_tools(query, top_k, always_include=self.used_tools)
+        return self.tool_registry.get_openai_tools(names)
+    
+    def _handle_tool_calls(self, tool_calls) -> List[str]:
+        """Handle tool calls from the assistant. Returns the called tool names."""
+        called = []
         for tool_call in tool_calls:
             function_name = tool_call.function.name
-            function_args = json.loads(tool_call.function.arguments)
+            called.append(function_name)
+            
+            # Look the tool up once, so a hot reload cannot remove it mid-call
+            function_args = None
+            try:
+                tool = self.tool_registry.get_tool(function_name)
+            except ValueError:
+                result = f"Error: Tool '{function_name}' not found"
+            else:
+                # Validate the arguments, returning any problems to the model in one result
+                try:
+                    function_args = self.tool_registry.parse_arguments(
+                        tool, tool_call.function.arguments
+                    )
+                except ToolArgumentError as e:
+                    result = e.to_result()
             
             # Display the tool call
-            format_tool_call(function_name, function_args)
+            if not self.quiet:
+                format_tool_call(function_name, function_args or {})
             
             # Execute the tool
-            result = self.tool_registry.execute_tool(function_name, **function_args)
+            if function_args is not None:
+                self.used_tools.add(function_name)
+                result = self._execute_tool(tool, function_args)
             
             # Display the result
-            format_tool_result(function_name, result)
+            if not self.quiet:
+                format_tool_result(function_name, result)
             
             # Add tool call and result to conversation
             self.conversation_history.append({
@@ -74,6 +140,34 @@ class ChatBot:
                 "tool_call_id": tool_call.id,
                 "content": str(result)
             })
+        
+        return called
+    
+    def _execute_tool(self, tool: BaseTool, arguments: Dict[str, Any]) -> Any:
+        """Execute a tool, sharing results of cacheable tools through the store."""
+        if self.store is None or not tool.cacheable:
+            return self.tool_registry.run_tool(tool, **arguments)
+        
+        key = f"{tool.name}:{json.dumps(arguments, sort_keys=True)}"
+        result = self.store.get_tool_result(key)
+        if result is None:
+            result = str(self.tool_registry.run_tool(tool, **arguments))
+            self.store.put_tool_result(key, result)
+        return result
+    
+    def _create_completion(self, tools: List[Dict[str, Any]]):
+        """Request a completion, waiting for the shared request budget if one is set."""
+        if self.store is not None and self.config.requests_per_minute > 0:
+            self.store.acquire(self.config.requests_per_minute)
+        
+        return self.client.chat.completions.create(
+            model=self.config.model,
+            messages=self.conversation_history,
+            max_tokens=self.config.max_tokens,
+            temperature=self.config.temperature,
+            tools=tools if tools else None,
+            tool_choice="auto" if tools else None
+        )
     
     def chat(self, message: str) -> str:
         """Send a message to the chatbot and get a response."""
@@ -84,34 +178,27 @@ class ChatBot:
         })
         
         try:
-            # Get available tools
-            tools = self.tool_registry.get_openai_tools()
+            # Get the tools relevant to this message
+            tools = self._select_tools()
             
             # Make API call
-            response = self.client.chat.completions.create(
-                model=self.config.model,
-                messages=self.conversation_history,
-                max_tokens=self.config.max_tokens,
-                temperature=self.config.temperature,
-                tools=tools if tools else None,
-                tool_choice="auto" if tools else None
-            )
+            response = self._create_completion(tools)
             
             message = response.choices[0].message
             
-            # Handle tool calls if present
-            if message.tool_calls:
-                self._handle_tool_calls(message.tool_calls)
+            # Handle tool calls, letting the model retry after tool errors
+            rounds = 0
+            while message.tool_calls and rounds < self.config.max_tool_rounds:
+                rounds += 1
+                called = self._handle_tool_calls(message.tool_calls)
+                
+                # Fall back to the full tool set if the model asked for a tool we did not send
+                sent = {tool["function"]["name"] for tool in tools}
+                if any(name not in sent for name in called):
+                    tools = self.tool_registry.get_openai_tools()
                 
-                # Get final response after tool calls
-                response = self.client.chat.completions.create(
-                    model=self.config.model,
-                    messages=self.conversation_history,
-                    max_tokens=self.config.max_tokens,
-                    temperature=self.config.temperature,
-                    tools=tools if tools else None,
-                    tool_choice="auto" if tools else None
-                )
+                # Get the next response after tool calls
+                response = self._create_completion(tools)
                 message = response.choices[0].message
             
             # Add assistant response to history
@@ -124,7 +211,8 @@ class ChatBot:
             
         except Exception as e:
             error_msg = f"Error communicating with OpenAI: {str(e)}"
-            format_error(error_msg)
+            if not self.quiet:
+                format_error(error_msg)
             return error_msg
     
     def handle_command(self, user_input: str) -> bool:
@@ -155,6 +243,11 @@ class ChatBot:
         console.print("[cyan]🔍 Discovering tools...[/cyan]")
         self.auto_discover_tools()
         
+        # Reload tool modules as they change on disk
+        if self.config.hot_reload:
+            self.tool_watcher = ToolWatcher(self.tool_registry)
+            self.tool_watcher.start()
+        
         try:
             while True:
                 user_input = input("\n💬 You: ").strip()
@@ -177,4 +270,7 @@ class ChatBot:
         except KeyboardInterrupt:
             console.print("\n[yellow]Goodbye! 👋[/yellow]")
         except Exception as e:
-            format_error(f"Unexpected error: {str(e)}") 
\ No newline at end of file
+            format_error(f"Unexpected error: {str(e)}")
+        finally:
+            if self.tool_watcher:
+                self.tool_watcher.stop() 
\ No newline at end of file
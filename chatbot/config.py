@@ -18,6 +18,10 @@ class Config:
     max_tokens: int = 1000
     temperature: float = 0.7
     system_prompt: str = "You are a helpful assistant with access to tools."
+    tool_top_k: int = 8
+    hot_reload: bool = True
+    max_tool_rounds: int = 2
+    requests_per_minute: int = 0
     
     @classmethod
     def from_env(cls) -> "Config":
@@ -33,5 +37,9 @@ class Config:
             system_prompt=os.getenv(
                 "SYSTEM_PROMPT", 
                 "You are a helpful assistant with access to tools."
-            )
+            ),
+            tool_top_k=int(os.getenv("TOOL_TOP_K", "8")),
+            hot_reload=os.getenv("HOT_RELOAD", "true").lower() in ("1", "true", "yes"),
+            max_tool_rounds=int(os.getenv("MAX_TOOL_ROUNDS", "2")),
+            requests_per_minute=int(os.getenv("REQUESTS_PER_MINUTE", "0"))
         ) 
\ No newline at end of file
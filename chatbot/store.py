@@ -0,0 +1,103 @@
+"""
+SQLite-backed state shared between chatbot worker processes.
+"""
+
+import json
+import sqlite3
+import time
+from typing import Any, Dict, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tool_results (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tool_results_created ON tool_results (created);
+CREATE TABLE IF NOT EXISTS requests (
+    timestamp REAL NOT NULL
+);
+"""
+
+
+class SharedStore:
+    """Sessions, tool result cache and request budget shared across processes."""
+
+    def __init__(self, path: str = "chatbot.db", max_tool_results: int = 10000):
+        self.path = path
+        self.max_tool_results = max_tool_results
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Connection for this process, opened on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Connections cannot cross process boundaries; each process opens its own
+        return {"path": self.path, "max_tool_results": self.max_tool_results, "_conn": None}
+
+    def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Load a session's saved state."""
+        row = self.conn.execute(
+            "SELECT state FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_session(self, session_id: str, state: Dict[str, Any]) -> None:
+        """Save a session's state."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO sessions (session_id, state) VALUES (?, ?)",
+            (session_id, json.dumps(state))
+        )
+
+    def get_tool_result(self, key: str) -> Optional[str]:
+        """Get a cached tool result."""
+        row = self.conn.execute(
+            "SELECT result FROM tool_results WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put_tool_result(self, key: str, result: str) -> None:
+        """Cache a tool result, dropping the oldest beyond the size limit."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO tool_results (key, result, created) VALUES (?, ?, ?)",
+            (key, result, time.time())
+        )
+        self.conn.execute(
+            "DELETE FROM tool_results WHERE key IN "
+            "(SELECT key FROM tool_results ORDER BY created DESC LIMIT -1 OFFSET ?)",
+            (self.max_tool_results,)
+        )
+
+    def clear_tool_results(self) -> None:
+        """Drop every cached tool result."""
+        self.conn.execute("DELETE FROM tool_results")
+
+    def acquire(self, requests_per_minute: int) -> None:
+        """Block until a request fits in the shared per-minute budget."""
+        while True:
+            now = time.time()
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.execute("DELETE FROM requests WHERE timestamp <= ?", (now - 60,))
+                count, oldest = self.conn.execute(
+                    "SELECT COUNT(*), MIN(timestamp) FROM requests"
+                ).fetchone()
+                if count < requests_per_minute:
+                    self.conn.execute("INSERT INTO requests (timestamp) VALUES (?)", (now,))
+                    self.conn.execute("COMMIT")
+                    return
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            time.sleep(max(oldest + 60 - now, 0.01))
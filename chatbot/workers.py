@@ -0,0 +1,254 @@
+"""
+Worker processes that spread chat sessions across CPU cores.
+"""
+
+import itertools
+import multiprocessing
+import os
+import queue
+import uuid
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .bot import ChatBot
+from .config import Config
+from .store import SharedStore
+
+# Spawn rather than fork so workers never inherit the parent's client or threads
+_context = multiprocessing.get_context("spawn")
+
+
+# Values of a worker's in-progress slot before it is ready and while it is idle
+_STARTING = -2
+_IDLE = -1
+
+
+def _worker_main(config: Config, store: SharedStore, run_id: str,
+                 requests, results, in_progress) -> None:
+    """Serve chat requests for the sessions routed to this worker."""
+    bot = ChatBot(config, store=store, quiet=True)
+    bot.auto_discover_tools()
+    in_progress.value = _IDLE
+
+    while True:
+        item = requests.get()
+        if item is None:
+            break
+
+        request_id, session_id, message = item
+        # Tell the supervisor which request to blame if this process dies
+        in_progress.value = request_id
+        request_key = f"{run_id}:{request_id}"
+        state = store.load_session(session_id)
+
+        if state is not None and state.get("last_request") == request_key:
+            # Resent after a crash that happened once the answer was saved
+            response = state["last_response"]
+        else:
+            bot.set_state(state)
+            response = bot.chat(message)
+            state = bot.get_state()
+            state["last_request"] = request_key
+            state["last_response"] = response
+            store.save_session(session_id, state)
+
+        results.put((request_id, response))
+        in_progress.value = _IDLE
+
+
+class WorkerPool:
+    """Supervisor that shards sessions across worker processes.
+
+    Every message of a session goes to the same worker, so a session's
+    messages are handled in order. Session state lives in the shared store,
+    so a crashed worker is restarted and its pending requests are resent.
+    Resending is idempotent: a request whose answer was already saved is
+    answered from the store instead of being run again.
+
+    The pool must be created under ``if __name__ == "__main__":`` because
+    workers are spawned and re-import the main module.
+    """
+
+    def __init__(self, config: Config, workers: Optional[int] = None,
+                 store_path: str = "chatbot.db", max_attempts: int = 2,
+                 max_idle_restarts: int = 3):
+        self.config = config
+        self.store = SharedStore(store_path)
+        self.size = workers or os.cpu_count() or 1
+        self.max_attempts = max_attempts
+        self.max_idle_restarts = max_idle_restarts
+        # Request ids restart at 0 for every pool, so saved ids are scoped to this run
+        self._run_id = uuid.uuid4().hex
+        self._results = _context.Queue()
+        self._requests: List = []
+        self._processes: List = []
+        self._in_progress: List = []
+        self._idle_deaths: List[int] = []
+        self._pending: Dict[int, Tuple[int, str, str, int]] = {}
+        self._responses: Dict[int, str] = {}
+        self._ids = itertools.count()
+
+    def __enter__(self) -> "WorkerPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _spawn(self, index: int) -> None:
+        requests = _context.Queue()
+        in_progress = _context.Value("q", _STARTING, lock=False)
+        process = _context.Process(
+            target=_worker_main,
+            args=(self.config, self.store, self._run_id, requests, self._results, in_progress),
+            name=f"chatbot-worker-{index}",
+            daemon=True
+        )
+        process.start()
+        self._requests[index] = requests
+        self._processes[index] = process
+        self._in_progress[index] = in_progress
+
+    def start(self) -> None:
+        """Start the worker processes and wait until they are ready.
+
+        Raises ``RuntimeError`` if a worker exits during start-up.
+        """
+        # Create the tables once so workers do not race to do it, and drop
+        # results cached by tools that may have changed since the last run
+        self.store.clear_tool_results()
+
+        self._requests = [None] * self.size
+        self._processes = [None] * self.size
+        self._in_progress = [None] * self.size
+        self._idle_deaths = [0] * self.size
+        for index in range(self.size):
+            self._spawn(index)
+
+        for index, process in enumerate(self._processes):
+            while self._in_progress[index].value == _STARTING:
+                process.join(timeout=0.1)
+                if not process.is_alive():
+                    self._terminate()
+                    raise RuntimeError(
+                        f"Worker {index} exited during start-up (exit code {process.exitcode})"
+                    )
+
+    def stop(self) -> None:
+        """Stop the worker processes after they finish queued requests."""
+        for requests in self._requests:
+            requests.put(None)
+        for process in self._processes:
+            process.join()
+        self._requests = []
+        self._processes = []
+        self._in_progress = []
+
+    def _terminate(self) -> None:
+        """Kill every worker without waiting for queued requests."""
+        for process in self._processes:
+            if process is not None and process.is_alive():
+                process.terminate()
+            if process is not None:
+                process.join()
+        self._requests = []
+        self._processes = []
+        self._in_progress = []
+
+    def route(self, session_id: str) -> int:
+        """Get the index of the worker that owns a session."""
+        return zlib.crc32(session_id.encode("utf-8")) % self.size
+
+    def submit(self, session_id: str, message: str) -> int:
+        """Queue a message for a session. Returns a request id."""
+        request_id = next(self._ids)
+        index = self.route(session_id)
+        self._pending[request_id] = (index, session_id, message, 1)
+        self._requests[index].put((request_id, session_id, message))
+        return request_id
+
+    def _saved_response(self, request_id: int, session_id: str) -> Optional[str]:
+        """Get the answer a worker saved for a request before it died, if any."""
+        state = self.store.load_session(session_id)
+        if state is not None and state.get("last_request") == f"{self._run_id}:{request_id}":
+            return state["last_response"]
+        return None
+
+    def _restart_crashed(self) -> Dict[int, str]:
+        """Restart dead workers and resend their pending requests.
+
+        Only the request a worker was handling when it died counts as a
+        failed attempt; requests still queued behind it are resent as is.
+        Returns responses for requests that are finished: answered before
+        the crash, or failed after using up their attempts. Raises
+        ``RuntimeError`` if a worker keeps dying without handling any request.
+        """
+        finished = {}
+        for index, process in enumerate(self._processes):
+            if process.is_alive():
+                continue
+
+            crashed = self._in_progress[index].value
+            if crashed in (_STARTING, _IDLE):
+                self._idle_deaths[index] += 1
+                if self._idle_deaths[index] > self.max_idle_restarts:
+                    self._terminate()
+                    raise RuntimeError(
+                        f"Worker {index} died {self._idle_deaths[index]} times without "
+                        f"handling a request (exit code {process.exitcode})"
+                    )
+            else:
+                self._idle_deaths[index] = 0
+
+            self._spawn(index)
+            for request_id, (owner, session_id, message, attempts) in list(self._pending.items()):
+                if owner != index:
+                    continue
+                if request_id == crashed:
+                    saved = self._saved_response(request_id, session_id)
+                    if saved is not None:
+                        del self._pending[request_id]
+                        finished[request_id] = saved
+                        continue
+                    if attempts >= self.max_attempts:
+                        del self._pending[request_id]
+                        finished[request_id] = f"Error: worker crashed while handling message (exit code {process.exitcode})"
+                        continue
+                    attempts += 1
+                self._pending[request_id] = (index, session_id, message, attempts)
+                self._requests[index].put((request_id, session_id, message))
+        return finished
+
+    def collect(self, request_ids: Iterable[int]) -> Dict[int, str]:
+        """Wait for the responses to the given requests."""
+        waiting = set(request_ids)
+        responses = {}
+
+        while True:
+            for request_id in waiting & self._responses.keys():
+                responses[request_id] = self._responses.pop(request_id)
+            waiting -= responses.keys()
+            if not waiting:
+                return responses
+
+            self._responses.update(self._restart_crashed())
+            try:
+                request_id, response = self._results.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            # A resent request can answer twice if the worker died after replying
+            pending = self._pending.pop(request_id, None)
+            if pending is not None:
+                self._responses[request_id] = response
+                self._idle_deaths[pending[0]] = 0
+
+    def chat_batch(self, messages: Iterable[Tuple[str, str]]) -> List[str]:
+        """Send (session_id, message) pairs and return responses in the same order."""
+        request_ids = [self.submit(session_id, message) for session_id, message in messages]
+        responses = self.collect(request_ids)
+        return [responses[request_id] for request_id in request_ids]
+
+    def chat(self, session_id: str, message: str) -> str:
+        """Send one message to a session and wait for the response."""
+        return self.chat_batch([(session_id, message)])[0]
@@ -4,5 +4,6 @@ Modular tool system for the chatbot.
 
 from .registry import ToolRegistry
 from .base import BaseTool
+from .validation import ToolArgumentError
 
-__all__ = ["ToolRegistry", "BaseTool"] 
\ No newline at end of file
+__all__ = ["ToolRegistry", "BaseTool", "ToolArgumentError"] 
\ No newline at end of file
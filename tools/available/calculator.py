@@ -9,6 +9,8 @@ from tools.base import BaseTool, ToolParameter
 class Calculator(BaseTool):
     """A tool for performing basic mathematical calculations."""
     
+    cacheable = True
+    
     @property
     def name(self) -> str:
         return "calculate"
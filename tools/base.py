@@ -19,6 +19,10 @@ class ToolParameter(BaseModel):
 class BaseTool(ABC):
     """Base class for all tools."""
     
+    # Tools whose result depends only on their arguments can set this to
+    # share results through the worker result cache
+    cacheable: bool = False
+    
     @property
     @abstractmethod
     def name(self) -> str:
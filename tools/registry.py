@@ -3,12 +3,19 @@ Tool registry for managing registered tools.
 """
 
 import importlib
+import importlib.util
 import os
+import sys
+import threading
+import weakref
 from pathlib import Path
-from typing import Dict, List, Any
+from types import ModuleType
+from typing import Dict, List, Any, Iterable, Optional, Tuple
 from rich.console import Console
 
 from .base import BaseTool
+from .selector import ToolSelector
+from .validation import ToolArgumentError, Validator, compile_validator, parse_arguments
 
 console = Console()
 
@@ -16,27 +23,108 @@ console = Console()
 class ToolRegistry:
     """Registry for managing tools."""
     
-    def __init__(self):
+    def __init__(self, quiet: bool = False):
+        self.quiet = quiet
         self._tools: Dict[str, BaseTool] = {}
+        # Keyed by tool instance so swapped-out tools drop their schemas
+        self._schemas: "weakref.WeakKeyDictionary[BaseTool, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+        self._validators: "weakref.WeakKeyDictionary[BaseTool, Validator]" = weakref.WeakKeyDictionary()
+        self._module_tools: Dict[str, List[str]] = {}
+        self._selector = ToolSelector()
+        self._selector_stale = True
+        self._lock = threading.Lock()
     
-    def register(self, tool: BaseTool) -> None:
-        """Register a tool."""
-        self._tools[tool.name] = tool
-        console.print(f"[green]✓[/green] Registered tool: {tool.name}")
+    def _print(self, message: str) -> None:
+        """Print a status message unless the registry is quiet."""
+        if not self.quiet:
+            console.print(message)
+    
+    def register(self, tool: BaseTool, module_name: Optional[str] = None) -> None:
+        """Register a tool, optionally recording the tool module it came from."""
+        with self._lock:
+            self._claim_names(module_name, [tool.name])
+            if module_name is not None:
+                owned = self._module_tools.setdefault(module_name, [])
+                if tool.name not in owned:
+                    owned.append(tool.name)
+            self._swap_tools({tool.name: tool})
+        self._print(f"[green]✓[/green] Registered tool: {tool.name}")
+    
+    def _claim_names(self, module_name: Optional[str], names: List[str]) -> None:
+        """Take tool names away from other modules. Callers must hold the registry lock."""
+        # Otherwise unloading the old module would remove the tool that replaced it
+        for other, owned in self._module_tools.items():
+            if other == module_name:
+                continue
+            moved = [name for name in owned if name in names]
+            if moved:
+                self._print(f"[yellow]Warning:[/yellow] {', '.join(moved)} from {other} "
+                            f"replaced by {module_name or 'a registered tool'}")
+                self._module_tools[other] = [name for name in owned if name not in moved]
+    
+    def _swap_tools(self, added: Dict[str, BaseTool], removed: Iterable[str] = ()) -> None:
+        """Swap in a new tool table. Callers must hold the registry lock."""
+        # Readers and in-flight tool calls keep using the table they already hold
+        tools = dict(self._tools)
+        for name in removed:
+            tools.pop(name, None)
+        tools.update(added)
+        self._tools = tools
+        self._selector_stale = True
     
     def get_tool(self, name: str) -> BaseTool:
         """Get a tool by name."""
-        if name not in self._tools:
+        tool = self._tools.get(name)
+        if tool is None:
             raise ValueError(f"Tool '{name}' not found")
-        return self._tools[name]
+        return tool
     
     def list_tools(self) -> List[str]:
         """List all registered tool names."""
         return list(self._tools.keys())
     
-    def get_openai_tools(self) -> List[Dict[str, Any]]:
-        """Get all tools in OpenAI format."""
-        return [tool.to_openai_tool() for tool in self._tools.values()]
+    def _get_schema(self, tool: BaseTool) -> Dict[str, Any]:
+        """Get a tool's OpenAI schema, building it on first use."""
+        schema = self._schemas.get(tool)
+        if schema is None:
+            schema = tool.to_openai_tool()
+            self._schemas[tool] = schema
+        return schema
+    
+    def _get_validator(self, tool: BaseTool) -> Validator:
+        """Get a tool's argument validator, compiling it on first use."""
+        validator = self._validators.get(tool)
+        if validator is None:
+            validator = compile_validator(tool.parameters)
+            self._validators[tool] = validator
+        return validator
+    
+    def parse_arguments(self, tool: BaseTool, raw: str) -> Dict[str, Any]:
+        """Parse, validate and coerce the raw JSON arguments of a tool call."""
+        try:
+            return self._get_validator(tool)(parse_arguments(raw))
+        except ToolArgumentError as e:
+            parameters = self._get_schema(tool)["function"]["parameters"]
+            raise ToolArgumentError(tool.name, e.errors, parameters) from None
+    
+    def get_openai_tools(self, names: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Get tools in OpenAI format, optionally restricted to the given names."""
+        tools = self._tools
+        if names is None:
+            names = tools.keys()
+        return [self._get_schema(tools[name]) for name in names if name in tools]
+    
+    def select_tools(
+        self,
+        query: str,
+        top_k: int,
+        always_include: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """Select the names of the tools most relevant to a query."""
+        if self._selector_stale:
+            self._selector_stale = False
+            self._selector.index(self.get_openai_tools())
+        return self._selector.select(query, top_k, always_include)
     
     def auto_discover_tools(self, tools_dir: str = "tools/available") -> None:
         """Auto-discover and register tools from a directory."""
@@ -49,27 +137,86 @@ class ToolRegistry:
             if py_file.name.startswith("__"):
                 continue
             
-            module_name = f"tools.available.{py_file.stem}"
             try:
-                module = importlib.import_module(module_name)
-                
-                # Look for classes that inherit from BaseTool
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (isinstance(attr, type) and 
-                        issubclass(attr, BaseTool) and 
-                        attr != BaseTool):
-                        tool_instance = attr()
-                        self.register(tool_instance)
+                module_name, _, tools = self._load_tools(py_file)
+                for tool_instance in tools:
+                    self.register(tool_instance, module_name)
                         
             except Exception as e:
                 console.print(f"[red]Error loading tool from {py_file}: {e}[/red]")
     
+    def _load_tools(self, py_file: Path, fresh: bool = False) -> Tuple[str, ModuleType, List[BaseTool]]:
+        """Import a tool module and instantiate its tools.
+
+        With ``fresh``, the module is executed into a new module object that
+        is not yet in ``sys.modules``, leaving the old one untouched.
+        """
+        module_name = f"tools.available.{py_file.stem}"
+        if fresh:
+            spec = importlib.util.spec_from_file_location(module_name, py_file)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        else:
+            module = importlib.import_module(module_name)
+        
+        # Look for classes that inherit from BaseTool
+        tools = []
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if (isinstance(attr, type) and 
+                issubclass(attr, BaseTool) and 
+                attr != BaseTool and
+                attr.__module__ == module_name):
+                tools.append(attr())
+        
+        return module_name, module, tools
+    
+    def reload_module(self, py_file: Path) -> None:
+        """Reload a changed or newly added tool module and swap in its tools."""
+        # Bytecode is validated by whole-second mtime and size, so a quick
+        # same-size edit could otherwise reload the stale cached version
+        try:
+            os.remove(importlib.util.cache_from_source(str(py_file)))
+        except OSError:
+            pass
+        
+        try:
+            # A new module object keeps in-flight calls on the old code and globals
+            module_name, module, tools = self._load_tools(py_file, fresh=True)
+        except Exception as e:
+            console.print(f"[red]Error reloading tool from {py_file}: {e}[/red]")
+            return
+        
+        names = [tool.name for tool in tools]
+        with self._lock:
+            previous = self._module_tools.get(module_name, [])
+            self._claim_names(module_name, names)
+            self._module_tools[module_name] = names
+            sys.modules[module_name] = module
+            self._swap_tools({tool.name: tool for tool in tools}, removed=previous)
+        
+        self._print(f"[green]↻[/green] Reloaded tools from {py_file.name}: "
+                    f"{', '.join(names) or 'none'}")
+    
+    def unload_module(self, py_file: Path) -> None:
+        """Unregister the tools of a removed tool module."""
+        module_name = f"tools.available.{py_file.stem}"
+        with self._lock:
+            removed = self._module_tools.pop(module_name, [])
+            self._swap_tools({}, removed=removed)
+            sys.modules.pop(module_name, None)
+        
+        self._print(f"[yellow]✗[/yellow] Unloaded tools from {py_file.name}: "
+                    f"{', '.join(removed) or 'none'}")
+    
     def execute_tool(self, name: str, **kwargs) -> Any:
         """Execute a tool by name."""
-        tool = self.get_tool(name)
+        return self.run_tool(self.get_tool(name), **kwargs)
+    
+    def run_tool(self, tool: BaseTool, **kwargs) -> Any:
+        """Execute a tool instance that was already looked up."""
         try:
             return tool.execute(**kwargs)
         except Exception as e:
-            console.print(f"[red]Error executing tool '{name}': {e}[/red]")
+            self._print(f"[red]Error executing tool '{tool.name}': {e}[/red]")
             return f"Error: {str(e)}" 
\ No newline at end of file
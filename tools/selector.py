@@ -0,0 +1,121 @@
+"""
+Relevance-based tool selection for trimming per-request tool schemas.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+_STOPWORDS = frozenset("""
+a about an and are as at be by can do does for from how i in is it me my no not
+of on or s so than that the this to was what when where which who why will with
+you your
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric terms (snake_case is split too)."""
+    return [term for term in _TOKEN_PATTERN.findall(text.lower()) if term not in _STOPWORDS]
+
+
+def _schema_text(schema: Dict[str, Any]) -> str:
+    """Flatten an OpenAI tool schema into searchable text."""
+    function = schema["function"]
+    parts = [function["name"], function.get("description", "")]
+    for name, prop in function["parameters"]["properties"].items():
+        parts.append(name)
+        parts.append(prop.get("description", ""))
+        parts.extend(str(value) for value in prop.get("enum") or [])
+    return " ".join(parts)
+
+
+class ToolSelector:
+    """BM25 index over tool names, descriptions and parameters."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._names: List[str] = []
+        self._term_freqs: List[Counter] = []
+        self._doc_lengths: List[int] = []
+        self._idf: Dict[str, float] = {}
+        self._avg_length = 0.0
+
+    def index(self, schemas: Iterable[Dict[str, Any]]) -> None:
+        """Build the index from a list of OpenAI tool schemas."""
+        self._names = []
+        self._term_freqs = []
+        self._doc_lengths = []
+        doc_freqs: Counter = Counter()
+
+        for schema in schemas:
+            terms = tokenize(_schema_text(schema))
+            freqs = Counter(terms)
+            self._names.append(schema["function"]["name"])
+            self._term_freqs.append(freqs)
+            self._doc_lengths.append(len(terms))
+            doc_freqs.update(freqs.keys())
+
+        count = len(self._names)
+        self._avg_length = sum(self._doc_lengths) / count if count else 0.0
+        # Terms shared by most tools say nothing about which one is meant
+        self._idf = {
+            term: math.log(1 + (count - freq + 0.5) / (freq + 0.5))
+            for term, freq in doc_freqs.items()
+            if count < 4 or freq <= count / 2
+        }
+
+    def score(self, query: str) -> Dict[str, float]:
+        """Score every indexed tool against a query."""
+        # Numbers in a request are arguments, not a hint about which tool is meant
+        query_terms = [
+            term for term in set(tokenize(query))
+            if term in self._idf and not term.isdigit()
+        ]
+        scores = {}
+
+        for name, freqs, length in zip(self._names, self._term_freqs, self._doc_lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / (self._avg_length or 1))
+            total = 0.0
+            for term in query_terms:
+                tf = freqs.get(term)
+                if tf:
+                    total += self._idf[term] * tf * (self.k1 + 1) / (tf + norm)
+            scores[name] = total
+
+        return scores
+
+    def select(
+        self,
+        query: str,
+        top_k: int,
+        always_include: Optional[Iterable[str]] = None,
+        min_score: float = 1.0
+    ) -> List[str]:
+        """Return the names of up to top-k relevant tools plus any pinned tools.
+
+        BM25 only sees word overlap, so when no tool matches the query well
+        enough, every tool is returned instead of a guess.
+        """
+        scores = self.score(query)
+        ranked = sorted(
+            (name for name, score in scores.items() if score > 0),
+            key=lambda name: scores[name],
+            reverse=True
+        )
+        if not ranked or scores[ranked[0]] < min_score:
+            return list(self._names)
+
+        selected = [name for name in (always_include or []) if name in scores]
+        pinned = set(selected)
+        added = 0
+        for name in ranked:
+            if added >= top_k:
+                break
+            if name not in pinned:
+                selected.append(name)
+                added += 1
+        return selected
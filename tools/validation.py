@@ -0,0 +1,172 @@
+"""
+Compiled validation and coercion of tool call arguments.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+from .base import ToolParameter
+
+Validator = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+_TRUE_STRINGS = {"true", "yes", "1"}
+_FALSE_STRINGS = {"false", "no", "0"}
+
+
+class ToolArgumentError(ValueError):
+    """Raised when tool call arguments cannot be parsed or validated."""
+
+    def __init__(self, tool_name: str, errors: List[Dict[str, str]],
+                 parameters: Optional[Dict[str, Any]] = None):
+        self.tool_name = tool_name
+        self.errors = errors
+        self.parameters = parameters
+        details = "; ".join(f"{error['parameter']}: {error['message']}" for error in errors)
+        super().__init__(f"Invalid arguments for tool '{tool_name}': {details}")
+
+    def to_result(self) -> str:
+        """Format the error as a tool result the model can correct from."""
+        result = {
+            "error": "invalid_arguments",
+            "tool": self.tool_name,
+            "errors": self.errors,
+        }
+        if self.parameters is not None:
+            result["expected"] = self.parameters
+        return json.dumps(result)
+
+
+def _coerce_string(value: Any) -> Any:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise TypeError
+
+
+def _coerce_integer(value: Any) -> Any:
+    if isinstance(value, bool):
+        raise TypeError
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        return int(value.strip())
+    raise TypeError
+
+
+def _coerce_number(value: Any) -> Any:
+    if isinstance(value, bool):
+        raise TypeError
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        return float(value.strip())
+    raise TypeError
+
+
+def _coerce_boolean(value: Any) -> Any:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    raise TypeError
+
+
+def _coerce_array(value: Any) -> Any:
+    if isinstance(value, list):
+        return value
+    raise TypeError
+
+
+def _coerce_object(value: Any) -> Any:
+    if isinstance(value, dict):
+        return value
+    raise TypeError
+
+
+_COERCERS = {
+    "string": _coerce_string,
+    "integer": _coerce_integer,
+    "number": _coerce_number,
+    "boolean": _coerce_boolean,
+    "array": _coerce_array,
+    "object": _coerce_object,
+}
+
+
+def compile_validator(parameters: List[ToolParameter]) -> Validator:
+    """Build a validator for a tool's parameters.
+
+    The validator returns the coerced arguments, or raises
+    ``ToolArgumentError`` listing every problem at once.
+    """
+    checks = []
+    for param in parameters:
+        coerce = _COERCERS.get(param.type)
+        enum = frozenset(param.enum) if param.enum else None
+        checks.append((param.name, param.type, coerce, enum, param.required))
+    known = frozenset(param.name for param in parameters)
+
+    def validate(arguments: Dict[str, Any]) -> Dict[str, Any]:
+        coerced = {}
+        errors = []
+
+        for name, type_name, coerce, enum, required in checks:
+            if name not in arguments:
+                if required:
+                    errors.append({"parameter": name, "message": "missing required argument"})
+                continue
+
+            value = arguments[name]
+            if coerce is not None:
+                try:
+                    value = coerce(value)
+                except (TypeError, ValueError):
+                    errors.append({
+                        "parameter": name,
+                        "message": f"expected {type_name}, got {type(value).__name__} {value!r}"
+                    })
+                    continue
+
+            if enum is not None and value not in enum:
+                errors.append({
+                    "parameter": name,
+                    "message": f"must be one of {sorted(enum)}, got {value!r}"
+                })
+                continue
+
+            coerced[name] = value
+
+        for name in arguments.keys() - known:
+            errors.append({"parameter": name, "message": "unexpected argument"})
+
+        if errors:
+            raise ToolArgumentError("", errors)
+        return coerced
+
+    return validate
+
+
+def parse_arguments(raw: Optional[str]) -> Dict[str, Any]:
+    """Parse a tool call's JSON arguments into a dict."""
+    # Tools without parameters are usually called with empty arguments
+    if not raw or raw == "{}":
+        return {}
+
+    try:
+        arguments = json.loads(raw)
+    except json.JSONDecodeError as e:
+        raise ToolArgumentError("", [{"parameter": "(arguments)", "message": f"invalid JSON: {e}"}])
+
+    if not isinstance(arguments, dict):
+        raise ToolArgumentError("", [{
+            "parameter": "(arguments)",
+            "message": f"expected a JSON object, got {type(arguments).__name__}"
+        }])
+    return arguments
@@ -0,0 +1,72 @@
+"""
+Watcher that hot-reloads tool modules when their files change.
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .registry import ToolRegistry
+
+
+class ToolWatcher:
+    """Polls a tools directory and reloads added, changed or removed modules."""
+
+    def __init__(self, registry: ToolRegistry, tools_dir: str = "tools/available",
+                 interval: float = 1.0):
+        self.registry = registry
+        self.tools_path = Path(tools_dir)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        """Get the modification time and size of every tool file."""
+        snapshot = {}
+        for py_file in self.tools_path.glob("*.py"):
+            if py_file.name.startswith("__"):
+                continue
+            try:
+                stat = py_file.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[py_file] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self) -> List[Path]:
+        """Check for changes once and apply them. Returns the changed files."""
+        current = self._scan()
+        changed = []
+
+        for py_file, signature in current.items():
+            if self._snapshot.get(py_file) != signature:
+                self.registry.reload_module(py_file)
+                changed.append(py_file)
+
+        for py_file in self._snapshot.keys() - current.keys():
+            self.registry.unload_module(py_file)
+            changed.append(py_file)
+
+        self._snapshot = current
+        return changed
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def start(self) -> None:
+        """Start watching in a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="tool-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None